@@ -1,44 +1,292 @@
 """
 A module for managing SQLite database operations for Page objects.
 
-This module provides functions to initialize, connect to, and interact with an SQLite database
+This module provides the `DB` class to initialize, connect to, and interact with an SQLite database
 designed to store Page objects. It includes CRUD operations for pages and handles database
-connections via context managers for safe transaction handling.
+connections via context managers for safe transaction handling. Each `DB` opens its connections once
+and caches them for its lifetime: a single read/write connection shared by all writers and a lazily
+grown pool of read-only connections.
+
+Module-level functions operate on a default `DB` instance set up by `init`, for code that only ever
+needs a single database.
 
 Classes and functions interact with the `Page` model from the `.model` module, ensuring
-data integrity and proper type handling. The module uses row factories to return query results
-as dictionaries for easier conversion to Page instances.
+data integrity and proper type handling. Query results are returned as `sqlite3.Row` objects,
+which support access both by index and by column name.
 """
 
+import atexit
+import os
 import sqlite3 as sql
+import threading
+import weakref
 from collections.abc import Iterable, Iterator
-from contextlib import AbstractContextManager, contextmanager
-from typing import Any
+from contextlib import AbstractContextManager, contextmanager, suppress
+from itertools import chain
 
 from .model import Page
 
+# Hot statements are kept as constant strings, so the connection's statement cache reuses their
+# prepared plans instead of compiling them on every call
+_STATEMENT_CACHE_SIZE = 128
+_SELECT_PAGES_SQL = "SELECT title, source_path, toc_path, modified FROM pages"
+_SELECT_PAGE_BY_TITLE_SQL = _SELECT_PAGES_SQL + " WHERE title = ?"
+_UPDATE_PAGE_MODIFIED_SQL = "UPDATE pages SET modified = ? WHERE title = ?"
+_UPDATE_PAGE_SQL = "UPDATE pages SET source_path = ?, toc_path = ?, modified = ? WHERE title = ?"
+_DELETE_PAGE_SQL = "DELETE FROM pages WHERE title = ?"
 
-def dict_factory(cur: sql.Cursor, row: sql.Row) -> dict[str, Any]:
-    """Convert a SQLite row to a dictionary with column names as keys.
+# Rows per multi-row INSERT, 4 parameters each keeps it under SQLite's historic 999 parameter cap
+_INSERT_CHUNK_SIZE = 200
+_INSERT_PAGE_SQL = "INSERT INTO pages (title, source_path, toc_path, modified) VALUES (?, ?, ?, ?)"
+_INSERT_PAGES_CHUNK_SQL = "INSERT INTO pages (title, source_path, toc_path, modified) VALUES " + ", ".join(  # noqa: S608
+    ["(?, ?, ?, ?)"] * _INSERT_CHUNK_SIZE
+)
 
-    Args:
-        cur: The cursor used for the query.
-        row: The raw SQLite row result.
 
-    Returns:
-        A dictionary mapping column names to their respective values.
-    """
-    return {col[0]: row[idx] for idx, col in enumerate(cur.description)}
+class DB:
+    """An SQLite database storing Page objects.
 
+    The database file is (re)created on initialization. Connections to it are cached by the
+    instance and closed by `close`, when the instance is garbage collected or at interpreter exit.
+    """
 
-sqlite_filename_global: str | None = None
+    def __init__(self, sqlite_filename: str) -> None:
+        """Initialize the database and create required tables.
+
+        This sets up the SQLite database file, removes any existing one (creating missing parent
+        directories), and ensures the `pages` table exists with the correct schema.
+
+        Args:
+            sqlite_filename: Path to the SQLite database file. Will be created if it doesn't exist.
+
+        Raises:
+            sqlite3.OperationalError: If there's an issue creating the database file or tables.
+        """
+        self.sqlite_filename = sqlite_filename
+
+        # Cached connections, see `connect`
+        self._rw_conn: sql.Connection | None = None
+        self._rw_lock = threading.Lock()
+        self._ro_conns: list[sql.Connection] = []
+        self._ro_lock = threading.Lock()
+        _instances.add(self)
+
+        # Clear database, including WAL leftovers of a previous run - SQLite creates the file itself
+        os.makedirs(os.path.dirname(sqlite_filename) or ".", exist_ok=True)
+        for suffix in ("", "-wal", "-shm"):
+            with suppress(FileNotFoundError):
+                os.unlink(sqlite_filename + suffix)
+
+        # Ensure database structure
+        with self.connect(write=True) as (_, cursor):
+            # Create pages table
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "title TEXT PRIMARY KEY NOT NULL, "
+                "source_path TEXT, "
+                "toc_path TEXT, "
+                "modified REAL) STRICT"
+            )
+
+    def connect(self, *, write: bool = False) -> AbstractContextManager[tuple[sql.Connection, sql.Cursor]]:
+        """Context manager for database connections with automatic transaction handling.
+
+        Yields a cached connection and a fresh cursor. Every block runs in its own transaction:
+        for write operations, changes are committed on exit. For read operations, transactions
+        are rolled back to prevent lock contention. Writers are serialized on the single
+        read/write connection, readers take a connection from the read-only pool.
+
+        If the block raises, the transaction is rolled back and the connection is closed and
+        dropped from the cache, so a connection in an unknown state is never reused.
+
+        Args:
+            write: If True, uses the read/write connection. Defaults to read-only.
+
+        Yields:
+            A tuple containing the active SQLite connection and cursor.
+
+        Raises:
+            sqlite3.Error: If connection or cursor creation fails.
+        """
+
+        @contextmanager
+        def wrapper() -> Iterator[tuple[sql.Connection, sql.Cursor]]:
+            if write:
+                with self._rw_lock:
+                    if self._rw_conn is None:
+                        self._rw_conn = self._open(write=True)
+                    try:
+                        yield from _transaction(self._rw_conn, write=True)
+                    except BaseException:
+                        self._rw_conn = None
+                        raise
+            else:
+                with self._ro_lock:
+                    connection = self._ro_conns.pop() if self._ro_conns else None
+                if connection is None:
+                    connection = self._open(write=False)
+                yield from _transaction(connection, write=False)
+                with self._ro_lock:
+                    self._ro_conns.append(connection)
+
+        return wrapper()
+
+    def close(self) -> None:
+        """Close all cached connections.
+
+        Connections are reopened lazily by the next `connect` call.
+        """
+        # Close readers first, so the writer is the last connection and can clean up the WAL
+        with self._ro_lock:
+            for connection in self._ro_conns:
+                connection.close()
+            self._ro_conns.clear()
+        with self._rw_lock:
+            if self._rw_conn is not None:
+                self._rw_conn.close()
+                self._rw_conn = None
+
+    def _open(self, *, write: bool) -> sql.Connection:
+        """Open a new connection to the database and apply per-connection pragmas.
+
+        Args:
+            write: If True, opens connection in read/write mode, otherwise in read-only mode.
+
+        Returns:
+            The opened connection in autocommit mode, transactions are managed by `connect`.
+        """
+        uri = f"file:{self.sqlite_filename}" if write else f"file:{self.sqlite_filename}?mode=ro"
+        connection = sql.connect(
+            uri, isolation_level=None, uri=True, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+        )
+        connection.row_factory = sql.Row
+        if write:
+            # Page size only applies to a database without content yet, and must precede the switch to WAL
+            connection.execute("PRAGMA page_size=8192")
+            # Journal mode is persistent, it only has to be set by the writer
+            connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA cache_size=-65536")
+        connection.execute("PRAGMA mmap_size=268435456")
+        return connection
+
+    def page_get_by_title(self, title: str) -> Page | None:
+        """Retrieve a page by its title.
+
+        Args:
+            title: The title of the page to fetch.
+
+        Returns:
+            A Page instance if found, otherwise None.
+        """
+        with self.connect() as (_, cursor):
+            cursor.execute(_SELECT_PAGE_BY_TITLE_SQL, (title,))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        # Data comes from our own schema, so skip validation
+        return Page.from_row(row)
+
+    def pages_all(self) -> list[Page]:
+        """Retrieve all pages.
+
+        Returns:
+            A list of Page instances, in no particular order.
+        """
+        with self.connect() as (_, cursor):
+            cursor.execute(_SELECT_PAGES_SQL)
+            rows = cursor.fetchall()
+        # Data comes from our own schema, so skip validation
+        from_row = Page.from_row
+        return [from_row(row) for row in rows]
+
+    def page_update_modified(self, page: Page) -> None:
+        """Update the modification timestamp of a page.
+
+        Args:
+            page: The Page object containing the new modified timestamp.
+        """
+        with self.connect(write=True) as (_, cursor):
+            cursor.execute(_UPDATE_PAGE_MODIFIED_SQL, (page.modified, page.title))
+
+    def pages_update_modified(self, pages: Iterable[Page]) -> None:
+        """Update the modification timestamps of multiple pages in a single transaction.
+
+        Args:
+            pages: An iterable of Page objects containing the new modified timestamps.
+        """
+        with self.connect(write=True) as (_, cursor):
+            cursor.executemany(_UPDATE_PAGE_MODIFIED_SQL, [(page.modified, page.title) for page in pages])
+
+    def pages_add(self, pages: Iterable[Page]) -> None:
+        """Insert multiple pages into the database in a single transaction.
+
+        All rows are inserted inside a single `BEGIN IMMEDIATE ... COMMIT`, so the whole batch
+        costs one WAL commit.
+
+        Args:
+            pages: An iterable of Page objects to add to the database.
+        """
+        with self.connect(write=True) as (_, cursor):
+            _pages_insert(cursor, _pages_tuples(pages))
+
+    def pages_clear(self) -> None:
+        """Delete all records from the pages table.
+
+        Warning: This operation is irreversible and removes all page entries.
+        """
+        with self.connect(write=True) as (_, cursor):
+            # noinspection SqlWithoutWhere
+            cursor.execute("DELETE FROM pages")
+
+    def pages_replace(self, pages: Iterable[Page]) -> None:
+        """Replace all records in the pages table with the given pages in a single transaction.
+
+        Equivalent to `pages_clear` followed by `pages_add`, but only rows that actually differ
+        are written: rows of removed pages are deleted, new pages are inserted and existing
+        pages are updated only if their metadata changed.
+
+        Args:
+            pages: An iterable of Page objects to store in the database.
+        """
+        pages_tuples = _pages_tuples(pages)
+        with self.connect(write=True) as (_, cursor):
+            cursor.execute(_SELECT_PAGES_SQL)
+            rows_stored = {row[0]: tuple(row) for row in cursor.fetchall()}
+
+            titles = {page_tuple[0] for page_tuple in pages_tuples}
+            cursor.executemany(_DELETE_PAGE_SQL, [(title,) for title in rows_stored.keys() - titles])
+            _pages_insert(cursor, [page_tuple for page_tuple in pages_tuples if page_tuple[0] not in rows_stored])
+            cursor.executemany(
+                _UPDATE_PAGE_SQL,
+                [
+                    (source_path, toc_path, modified, title)
+                    for title, source_path, toc_path, modified in pages_tuples
+                    if title in rows_stored and rows_stored[title] != (title, source_path, toc_path, modified)
+                ],
+            )
+
+
+# All live instances, to close their connections at interpreter exit
+_instances: weakref.WeakSet[DB] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_all() -> None:
+    """Close connections of all live `DB` instances."""
+    for db in list(_instances):
+        db.close()
+
+
+# Default instance used by the module-level functions below
+_default_db: DB | None = None
 
 
 def init(sqlite_filename: str) -> None:
-    """Initialize the database and create required tables.
+    """Initialize the default database, see `DB`.
 
-    This function sets up the SQLite database file, truncates any existing content,
-    and ensures the `pages` table exists with the correct schema.
+    Connections of the previous default database are closed.
 
     Args:
         sqlite_filename: Path to the SQLite database file. Will be created if it doesn't exist.
@@ -46,110 +294,119 @@ def init(sqlite_filename: str) -> None:
     Raises:
         sqlite3.OperationalError: If there's an issue creating the database file or tables.
     """
-    global sqlite_filename_global
-    sqlite_filename_global = sqlite_filename
-
-    # Clear database
-    with open(sqlite_filename, "w") as _:
-        pass
-
-    # Ensure database structure
-    with connect(write=True) as (_, cursor):
-        # Create pages table
-        cursor.execute(
-            "CREATE TABLE IF NOT EXISTS pages ("
-            "title TEXT PRIMARY KEY NOT NULL, "
-            "source_path TEXT, "
-            "toc_path TEXT, "
-            "modified REAL) STRICT"
-        )
+    global _default_db
+    if _default_db is not None:
+        _default_db.close()
+    _default_db = DB(sqlite_filename)
 
 
-def connect(*, write: bool = False) -> AbstractContextManager[tuple[sql.Connection, sql.Cursor]]:
-    """Context manager for database connections with automatic transaction handling.
-
-    Yields a connection and cursor tuple. For write operations, changes are committed on exit.
-    For read operations, transactions are rolled back to prevent lock contention.
-
-    Args:
-        write: If True, opens connection in read/write mode. Defaults to read-only.
-
-    Yields:
-        A tuple containing the active SQLite connection and cursor.
+def _get_default() -> DB:
+    """Return the default database.
 
     Raises:
-        sqlite3.Error: If connection or cursor creation fails.
+        RuntimeError: If `init` wasn't called yet.
     """
+    if _default_db is None:
+        raise RuntimeError("Database is not initialized, call init() first")  # noqa: TRY003
+    return _default_db
+
+
+def connect(*, write: bool = False) -> AbstractContextManager[tuple[sql.Connection, sql.Cursor]]:
+    """Context manager for connections to the default database, see `DB.connect`."""
+    return _get_default().connect(write=write)
 
-    @contextmanager
-    def wrapper() -> Iterator[tuple[sql.Connection, sql.Cursor]]:
-        uri = f"file:{sqlite_filename_global}" if write else f"file:{sqlite_filename_global}?mode=ro"
-        connection = sql.connect(uri, autocommit=False, isolation_level=None, uri=True)
-        try:
-            connection.row_factory = dict_factory
-            cursor = connection.cursor()
-            try:
-                yield connection, cursor
-            except Exception:
-                cursor.close()
-                connection.rollback()
-                raise
-            else:
-                cursor.close()
-                if write:
-                    connection.commit()
-                else:
-                    connection.rollback()
-        finally:
-            connection.close()
 
-    return wrapper()
+def close() -> None:
+    """Close all cached connections of the default database, see `DB.close`."""
+    if _default_db is not None:
+        _default_db.close()
 
 
 def page_get_by_title(title: str) -> Page | None:
-    """Retrieve a page by its title.
+    """Retrieve a page by its title from the default database, see `DB.page_get_by_title`."""
+    return _get_default().page_get_by_title(title)
 
-    Args:
-        title: The title of the page to fetch.
 
-    Returns:
-        A Page instance if found, otherwise None.
-    """
-    with connect() as (_, cursor):
-        cursor.execute("SELECT * FROM pages WHERE title = ?", (title,))
-        row = cursor.fetchone()
-    return Page(**row) if row else None
+def pages_all() -> list[Page]:
+    """Retrieve all pages from the default database, see `DB.pages_all`."""
+    return _get_default().pages_all()
 
 
 def page_update_modified(page: Page) -> None:
-    """Update the modification timestamp of a page.
+    """Update the modification timestamp of a page in the default database, see `DB.page_update_modified`."""
+    _get_default().page_update_modified(page)
 
-    Args:
-        page: The Page object containing the new modified timestamp.
-    """
-    with connect(write=True) as (_, cursor):
-        cursor.execute("UPDATE pages SET modified = ? WHERE title = ?", (page.modified, page.title))
+
+def pages_update_modified(pages: Iterable[Page]) -> None:
+    """Update the modification timestamps of multiple pages in the default database, see `DB.pages_update_modified`."""
+    _get_default().pages_update_modified(pages)
 
 
 def pages_add(pages: Iterable[Page]) -> None:
-    """Insert multiple pages into the database in a single transaction.
+    """Insert multiple pages into the default database, see `DB.pages_add`."""
+    _get_default().pages_add(pages)
+
+
+def pages_clear() -> None:
+    """Delete all records from the pages table of the default database, see `DB.pages_clear`."""
+    _get_default().pages_clear()
+
+
+def pages_replace(pages: Iterable[Page]) -> None:
+    """Replace all records in the pages table of the default database, see `DB.pages_replace`."""
+    _get_default().pages_replace(pages)
+
+
+def _transaction(connection: sql.Connection, *, write: bool) -> Iterator[tuple[sql.Connection, sql.Cursor]]:
+    """Run a single transaction on the connection, yielding it once together with a fresh cursor.
 
     Args:
-        pages: An iterable of Page objects to add to the database.
+        connection: The connection to run the transaction on.
+        write: If True, the transaction takes the write lock upfront and is committed, otherwise
+               it is rolled back.
+
+    Yields:
+        A tuple containing the connection and cursor.
     """
-    pages_tuples = [(page.title, str(page.source_path), page.toc_path, page.modified) for page in pages]
+    cursor = connection.cursor()
+    try:
+        # Writers lock immediately instead of upgrading a read lock mid-transaction
+        cursor.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        yield connection, cursor
+        cursor.execute("COMMIT" if write else "ROLLBACK")
+    except BaseException:
+        cursor.close()
+        # Closing the connection rolls back the pending transaction
+        connection.close()
+        raise
+    else:
+        cursor.close()
+
+
+def _pages_tuples(pages: Iterable[Page]) -> list[tuple[str, str, str, float]]:
+    """Convert pages to rows of the pages table.
 
-    with connect(write=True) as (_, cursor):
-        cursor.executemany(
-            "INSERT INTO pages (title, source_path, toc_path, modified) VALUES (?, ?, ?, ?)", pages_tuples
-        )
+    Args:
+        pages: An iterable of Page objects.
+
+    Returns:
+        A list of `(title, source_path, toc_path, modified)` tuples.
+    """
+    return [(page.title, str(page.source_path), page.toc_path, page.modified) for page in pages]
 
 
-def pages_clear() -> None:
-    """Delete all records from the pages table.
+def _pages_insert(cursor: sql.Cursor, pages_tuples: list[tuple[str, str, str, float]]) -> None:
+    """Insert rows of the pages table using the given cursor of a write transaction.
 
-    Warning: This operation is irreversible and removes all page entries.
+    Rows are inserted in chunks of `_INSERT_CHUNK_SIZE` by a multi-row `INSERT ... VALUES`
+    statement, the remaining tail is inserted by the single-row statement.
+
+    Args:
+        cursor: Cursor of an active write transaction.
+        pages_tuples: Rows to insert, as returned by `_pages_tuples`.
     """
-    with connect(write=True) as (_, cursor):
-        # noinspection SqlWithoutWhere
-        cursor.execute("DELETE FROM pages")
+    tail_start = len(pages_tuples) - len(pages_tuples) % _INSERT_CHUNK_SIZE
+    for chunk_start in range(0, tail_start, _INSERT_CHUNK_SIZE):
+        chunk = pages_tuples[chunk_start : chunk_start + _INSERT_CHUNK_SIZE]
+        cursor.execute(_INSERT_PAGES_CHUNK_SQL, tuple(chain.from_iterable(chunk)))
+    cursor.executemany(_INSERT_PAGE_SQL, pages_tuples[tail_start:])
@@ -3,8 +3,8 @@
 This module provides the `LiveProject` class, which enables live-editing functionality
 for a project. It allows querying rendered HTML content by page title, automatically
 rebuilding the project if its structure changes, or re-rendering individual pages
-if their content is modified. The class integrates with a database to track page
-metadata and timestamps, ensuring efficient updates and rendering.
+if their content is modified. The class keeps page metadata and timestamps in memory
+and persists them to a database, ensuring efficient updates and rendering.
 
 The module is designed to support dynamic content updates and is suitable for
 use in environments where live previews of changes are required.
@@ -13,21 +13,45 @@ use in environments where live previews of changes are required.
 import logging
 import os
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from . import db
+from .db import DB
 from .model import Page
 from .project import Project
 from .renderer import BaseRenderer
 
+# Maximum number of rendered pages kept in memory
+_RENDERED_CACHE_SIZE = 1024
+# Number of pending timestamp updates written to the database at once
+_PENDING_MODIFIED_FLUSH_SIZE = 64
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Writes data to a file with raw OS calls, bypassing Python's text and buffering layers.
+
+    Args:
+        path (Path): The file to create or overwrite.
+        data (bytes): The data to write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
 
 class LiveProject:
     """A class for managing live-editing and rendering of a project's source pages.
 
     This class provides functionality to query rendered HTML content by page title,
     automatically rebuild the project when its structure changes, and re-render
-    individual pages when their content is modified. It uses a database to track
-    page metadata and timestamps for efficient updates.
+    individual pages when their content is modified. Page metadata and timestamps are
+    tracked in memory for efficient updates and persisted to a database.
     """
 
     def __init__(
@@ -56,16 +80,25 @@ class LiveProject:
         self.output_extension = output_extension
 
         if db_path is None:
-            db.init(tempfile.NamedTemporaryFile(delete=False, suffix=".sqlite").name)
-        else:
-            db_path_obj = Path(db_path)
-            if not db_path_obj.is_file():
-                db_path_obj.parent.mkdir(parents=True, exist_ok=True)
-            db.init(db_path)
+            db_path = tempfile.NamedTemporaryFile(delete=False, suffix=".sqlite").name
+        self.db = DB(db_path)
 
         self.project = Project(root_path, glob)
         self.renderer = renderer
 
+        # Pages of the last build by title, modification timestamps are kept up to date in place
+        self._pages_by_title: dict[str, Page] = {}
+        # Pages re-rendered on request, whose new timestamps are not written to the database yet
+        self._pending_modified: dict[str, Page] = {}
+        # Rendered content and source modification time it was rendered from, by page title
+        self._rendered_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # Guards the rendered cache and pending timestamps, pages may be requested from multiple threads
+        self._lock = threading.Lock()
+        # Serializes builds and renders, so no thread sees a half built project or a half written output file
+        self._build_lock = threading.RLock()
+        # Structure hash of the last completed build, set only after all of its pages are rendered
+        self._structure_hash_built: int | None = None
+
     def get_rendered_content(self, title: str) -> str | None:
         """Retrieves the rendered HTML content for a page by its title.
 
@@ -79,51 +112,150 @@ class LiveProject:
         Returns:
             str | None: The rendered HTML content as a string, or `None` if the page does not exist.
         """
-        if self.is_project_needs_rebuild():
-            logging.info(f"Source ({self.root_path}) structure hash mismatch, rebuilding")
-            self.build()
-
-        # Now structure is validated - we can fetch the page
-        # Get page metadata from db
-        page = db.page_get_by_title(title)
-        if page is None:
-            # Looks like this page doesn't exist :/
-            return None
+        # Fast path - the page is up to date and in memory, no lock is held while checking it
+        rendered_content = self._rendered_content_cached(title)
+        if rendered_content is not None:
+            return rendered_content
 
-        # Page exist - check timestamp
-        page_timestamp_real = os.path.getmtime(page.source_path)
-        if page_timestamp_real != page.modified:
-            # Page must be rebuilt
-            logging.info(f"Page ({page.title}) timestamp mismatch, rendering")
-            self.render(page)
-            db.page_update_modified(page)
+        with self._build_lock:
+            # Checked again under the lock, another thread may have rebuilt the project while this one waited
+            if self.is_project_needs_rebuild():
+                logging.info(f"Source ({self.root_path}) structure hash mismatch, rebuilding")
+                self.build()
 
-        # Page exists, and we have relevant info about it - now we can safely display it
-        output_path = self.page_output_path(page)
-        return output_path.read_text(encoding="utf-8")
+            # Now structure is validated - we can fetch the page
+            page = self._pages_by_title.get(title)
+            if page is None:
+                # Looks like this page doesn't exist :/
+                return None
+
+            # Page exist - check timestamp
+            page_timestamp_real = os.path.getmtime(page.source_path_str)
+            if page_timestamp_real != page.modified:
+                # Page must be rebuilt
+                logging.info(f"Page ({page.title}) timestamp mismatch, rendering")
+                self.render(page, page_timestamp_real)
+                # Keep reads free of database writes - timestamps are persisted in batches
+                with self._lock:
+                    self._pending_modified[page.title] = page
+                    flush_needed = len(self._pending_modified) >= _PENDING_MODIFIED_FLUSH_SIZE
+                if flush_needed:
+                    self.flush()
+
+            # Page exists, and we have relevant info about it - now we can safely display it
+            with self._lock:
+                cached = self._rendered_cache.get(page.title)
+                if cached is not None and cached[0] == page.modified:
+                    self._rendered_cache.move_to_end(page.title)
+                    return cached[1]
+            output_path = self.page_output_path(page)
+            rendered_content = output_path.read_text(encoding="utf-8")
+            self._rendered_cache_put(page, rendered_content)
+            return rendered_content
+
+    def _rendered_content_cached(self, title: str) -> str | None:
+        """Retrieves the rendered content of a page from memory, if the project and the page are up to date.
+
+        Args:
+            title (str): The title of the page to retrieve.
+
+        Returns:
+            str | None: The rendered HTML content, or `None` if it must be retrieved under the build lock.
+        """
+        if self.is_project_needs_rebuild():
+            return None
+        with self._lock:
+            cached = self._rendered_cache.get(title)
+        if cached is None:
+            return None
+        try:
+            if os.path.getmtime(self._pages_by_title[title].source_path_str) != cached[0]:
+                return None
+        except (KeyError, OSError):
+            # Page was removed meanwhile
+            return None
+        with self._lock:
+            # Entry may have been evicted or replaced while the source was checked
+            if self._rendered_cache.get(title) is cached:
+                self._rendered_cache.move_to_end(title)
+        return cached[1]
 
     def build(self) -> None:
         """Rebuilds the entire project.
 
-        This method clears all stored page metadata from the database, rebuilds the
-        project structure, updates the renderer, and re-renders all pages. It also
-        updates the database with the new page metadata.
+        This method rebuilds the project structure, updates the renderer, and re-renders
+        all pages. It then replaces all stored page metadata in the database with the new
+        page metadata in a single transaction.
         """
-        # Clear pages info from db
-        db.pages_clear()
+        with self._build_lock:
+            self._build()
 
+    def _build(self) -> None:
+        """Rebuilds the entire project, see `build`. Must be called with the build lock held."""
         # Rebuild project metadata
         self.project.build()
+        self._pages_by_title = {page.title: page for page in self.project.pages_stored}
+        with self._lock:
+            # All timestamps are written by the replace below
+            self._pending_modified.clear()
+            self._rendered_cache.clear()
 
         # Update renderer
         self.renderer.build(self.project.pages_stored)
-        # Render all pages
-        for page in self.project.pages_stored:
-            self.render(page)
-        # Add project metadata to db
-        db.pages_add(self.project.pages_stored)
+        # Create output directories once, instead of on every render
+        for output_dir in {self.page_output_path(page).parent for page in self.project.pages_stored}:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        # Render all pages, with timestamps of sources taken by the project build
+        mtimes = self.project.mtimes_stored
+        pages = self.project.pages_stored
+        modified = [mtimes.get(page.source_path_str) for page in pages]
+        if self.renderer.thread_safe and len(pages) > 1:
+            # Rendering is mostly file I/O, so threads overlap reads and writes of different pages
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                rendered_contents = list(executor.map(self._render, pages, modified))
+        else:
+            rendered_contents = [self._render(page, page_modified) for page, page_modified in zip(pages, modified)]
+        for page, rendered_content in zip(pages, rendered_contents):
+            self._rendered_cache_put(page, rendered_content)
+        # Replace project metadata in db
+        self.db.pages_replace(self.project.pages_stored)
+        # Project is fully built now, requests may skip the build lock
+        self._structure_hash_built = self.project.structure_hash_stored
 
-    def render(self, page: Page) -> None:
+    def flush(self) -> None:
+        """Writes timestamps of pages re-rendered on request to the database in a single transaction."""
+        # Take the pending pages at once, so requests from other threads can keep adding new ones
+        with self._lock:
+            pages = list(self._pending_modified.values())
+            self._pending_modified.clear()
+        if pages:
+            self.db.pages_update_modified(pages)
+
+    def close(self) -> None:
+        """Flushes pending timestamps and closes the database connections.
+
+        The project stays usable, connections are reopened on the next database access.
+        """
+        self.flush()
+        self.db.close()
+
+    def __enter__(self) -> "LiveProject":
+        """Enters the context, the project is closed on exit.
+
+        Returns:
+            LiveProject: This project.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the project, see `close`.
+
+        Args:
+            *exc_info (object): Exception type, value and traceback, if the context exited with an exception.
+        """
+        self.close()
+
+    def render(self, page: Page, modified: float | None = None) -> None:
         """Renders a single page and updates its metadata.
 
         This method reads the source content of the page, renders it using the
@@ -132,13 +264,49 @@ class LiveProject:
 
         Args:
             page (Page): The page to render.
+            modified (float, optional): The source file's modification timestamp, if the caller
+                                        has just read it. It's read from the file otherwise.
         """
-        source_content = page.source_path.read_text(encoding="utf-8")
-        page.modified = os.path.getmtime(page.source_path)
-        rendered_content = self.renderer.render(source_content, page)
+        rendered_content = self._render(page, modified)
+        self._rendered_cache_put(page, rendered_content)
+
+    def _render(self, page: Page, modified: float | None) -> str:
+        """Renders a single page and writes the output, without touching the rendered cache.
+
+        Args:
+            page (Page): The page to render.
+            modified (float | None): The source file's modification timestamp, if already known.
+
+        Returns:
+            str: The rendered HTML content.
+        """
+        # Timestamp is taken before reading, so a concurrent edit is never marked as rendered
+        page.modified = os.path.getmtime(page.source_path_str) if modified is None else modified
+        with open(page.source_path_str, encoding="utf-8") as source_file:
+            source_content = source_file.read()
+        rendered_content = source_content if self.renderer.passthrough else self.renderer.render(source_content, page)
         output_path = self.page_output_path(page)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(rendered_content, encoding="utf-8")
+        output_data = rendered_content.encode("utf-8")
+        try:
+            _write_bytes(output_path, output_data)
+        except FileNotFoundError:
+            # Output directories are created by build, but may have been removed since
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_bytes(output_path, output_data)
+        return rendered_content
+
+    def _rendered_cache_put(self, page: Page, rendered_content: str) -> None:
+        """Stores rendered content of a page in memory, evicting the least recently used page if full.
+
+        Args:
+            page (Page): The page, whose `modified` timestamp matches the rendered content.
+            rendered_content (str): The rendered HTML content.
+        """
+        with self._lock:
+            self._rendered_cache[page.title] = (page.modified, rendered_content)
+            self._rendered_cache.move_to_end(page.title)
+            if len(self._rendered_cache) > _RENDERED_CACHE_SIZE:
+                self._rendered_cache.popitem(last=False)
 
     def page_output_path(self, page: Page) -> Path:
         """Calculates the output file path for a given page.
@@ -157,6 +325,9 @@ class LiveProject:
         Returns:
             bool: `True` if the project structure has changed, `False` otherwise.
         """
-        hash_stored = self.project.structure_hash_stored
+        # Compared against the last completed build, the project's stored hash is updated early during a build
+        hash_built = self._structure_hash_built
+        if hash_built is None:
+            return True
         hash_actual = self.project.structure_hash_get_actual()
-        return hash_stored != hash_actual
+        return hash_built != hash_actual
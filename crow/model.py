@@ -16,7 +16,11 @@ Functions:
       instances.
 """
 
+import os
+from collections.abc import Sequence
+from functools import cached_property
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -31,8 +35,13 @@ class Page(BaseModel):
                   Immutable once set.
         modified: The timestamp of the last modification to the page. Defaults to 0.0.
 
+    Properties:
+        source_path_str: The source path as a string, computed once.
+
     Methods:
         from_source_path: Constructs a Page instance from a source file path and project directory.
+        from_dir_entry: Constructs a Page instance from a directory entry and project directory.
+        from_row: Constructs a Page instance from a database row.
     """
 
     title: str = Field(frozen=True)
@@ -40,6 +49,11 @@ class Page(BaseModel):
     toc_path: str = Field(frozen=True)
     modified: float = 0.0
 
+    @cached_property
+    def source_path_str(self) -> str:
+        """The source path as a string, for passing to OS functions without converting it every time."""
+        return str(self.source_path)
+
     @classmethod
     def from_source_path(cls, source_path: Path, project_dir: Path) -> "Page":
         """Constructs a Page instance from a source file path and project directory.
@@ -54,9 +68,63 @@ class Page(BaseModel):
 
         Returns:
             A Page instance with the calculated title, TOC path, and default metadata.
+
+        Raises:
+            ValueError: If the source path is not within the project directory.
         """
-        rel_source_path_parts = source_path.relative_to(project_dir).parts
-        if source_path.stem == "index":
+        # Plain string slicing instead of path arithmetic, this runs for every page of the project
+        source_path_str = str(source_path)
+        project_dir_prefix = os.path.join(project_dir, "")
+        if os.path.normcase(source_path_str).startswith(os.path.normcase(project_dir_prefix)):
+            rel_source_path_parts: Sequence[str] = source_path_str[len(project_dir_prefix) :].split(os.sep)
+        else:
+            # Relative roots like "." don't appear literally in joined paths, fall back to path arithmetic
+            rel_source_path_parts = source_path.relative_to(project_dir).parts
+        return cls._from_rel_parts(source_path, rel_source_path_parts, _stem(rel_source_path_parts[-1]))
+
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry[str], project_dir: Path) -> "Page":
+        """Constructs a Page instance from a directory entry found by walking the project directory.
+
+        Same as `from_source_path`, but the relative path is computed with string operations
+        on the entry's path instead of path arithmetic.
+
+        Args:
+            entry: The directory entry of the page's source file, found within the project directory.
+            project_dir: The root directory of the project.
+
+        Returns:
+            A Page instance with the calculated title, TOC path, and default metadata.
+        """
+        # Entry paths are the project directory joined with relative parts
+        rel_source_path_parts = entry.path[len(os.path.join(project_dir, "")) :].split(os.sep)
+        return cls._from_rel_parts(Path(entry.path), rel_source_path_parts, _stem(entry.name))
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Page":
+        """Constructs a Page instance from a database row, skipping validation.
+
+        Args:
+            row: A row of the pages table, as (title, source_path, toc_path, modified).
+
+        Returns:
+            A Page instance with the row's data.
+        """
+        return cls.model_construct(title=row[0], source_path=Path(row[1]), toc_path=row[2], modified=row[3])
+
+    @classmethod
+    def _from_rel_parts(cls, source_path: Path, rel_source_path_parts: Sequence[str], stem: str) -> "Page":
+        """Constructs a Page instance from the source path split into parts relative to the project directory.
+
+        Args:
+            source_path: The absolute path to the page's source file.
+            rel_source_path_parts: Parts of the source path relative to the project directory.
+            stem: The source file name without extension.
+
+        Returns:
+            A Page instance with the calculated title, TOC path, and default metadata.
+        """
+        if stem == "index":
             # Check if this index is the top level index or not
             if len(rel_source_path_parts) > 1:
                 # Folder name will be the title of this page (or none, if it's top level index)
@@ -69,20 +137,27 @@ class Page(BaseModel):
                 toc_path = ""
         else:
             # Title is just filename without extension - available for any page
-            title = source_path.stem
-            if len(rel_source_path_parts) >= 2:
-                # TOC path is combined path to file and title
-                toc_path = "/".join(
-                    rel_source_path_parts[i] if i != len(rel_source_path_parts) - 1 else title
-                    for i in range(len(rel_source_path_parts))
-                )
-            else:
-                # TOC path unavailable
-                toc_path = ""
+            title = stem
+            # TOC path is combined path to file and title, unavailable for top level pages
+            toc_path = "/".join((*rel_source_path_parts[:-1], title)) if len(rel_source_path_parts) >= 2 else ""
 
-        return cls(
+        # All fields are computed here with the right types, so skip validation
+        return cls.model_construct(
             title=title,
             source_path=source_path,
             toc_path=toc_path,
             modified=0.0,  # this value is set when we render the page
         )
+
+
+def _stem(name: str) -> str:
+    """Returns the file name without its extension, same as `PurePath.stem`.
+
+    Args:
+        name: The file name.
+
+    Returns:
+        The file name without the last suffix.
+    """
+    i = name.rfind(".")
+    return name[:i] if 0 < i < len(name) - 1 else name
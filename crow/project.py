@@ -9,13 +9,20 @@ The module is designed to handle file structure changes efficiently by using
 hashing and iterators, making it suitable for projects with dynamic content.
 """
 
-from collections.abc import Sequence
+import os
+import time
+from collections.abc import Iterable, Sequence
+from fnmatch import fnmatch
 from pathlib import Path
 
 from natsort import os_sorted
 
 from .model import Page
 
+# Directories modified within this window before a snapshot may still change without their
+# mtime changing (coarse filesystem timestamps), so such snapshots are never cached
+_RACY_MTIME_NS = 1_000_000_000
+
 
 class Project:
     """A class representing a project that manages a collection of pages.
@@ -40,6 +47,11 @@ class Project:
         self._pages: list[Page] = []
         self._structure_stored: list[Path] = []
         self._structure_hash_stored = 0
+        self._mtimes_stored: dict[str, float] = {}
+
+        # Actual structure hash cached along with mtimes of all project directories, kept in a single
+        # attribute so a thread checking the structure never sees a hash paired with another snapshot
+        self._cached_actual: tuple[int, dict[str, int]] | None = None
 
     def build(self) -> list[Path]:
         """(Re)Builds the project by discovering and organizing source files.
@@ -52,31 +64,153 @@ class Project:
             list[Path]: List of Path objects representing the project's file structure.
         """
         self._pages.clear()
-        self._structure_stored = self.structure_get_actual()
-        self._structure_hash_stored = hash(tuple(self._structure_stored))
-        for source_path in os_sorted(self._structure_stored):
-            self._pages.append(Page.from_source_path(source_path, self._root_path))
+        dir_mtimes = self._dir_mtimes_get()
+        entries = os_sorted(self._walk(), key=lambda entry: entry.path)
+        self._pages.extend(Page.from_dir_entry(entry, self._root_path) for entry in entries)
+        self._structure_stored = [page.source_path for page in self._pages]
+        self._structure_hash_stored = self.structure_hash_compute(entry.path for entry in entries)
+        # Stat entries found by the walk, directory listings already carry file attributes on Windows
+        self._mtimes_stored = {}
+        for page, entry in zip(self._pages, entries):
+            try:
+                self._mtimes_stored[page.source_path_str] = entry.stat().st_mtime
+            except FileNotFoundError:
+                # Removed since the directory was listed
+                continue
+        # The stored structure is also the actual one now
+        self._cache_actual_hash(self._structure_hash_stored, dir_mtimes)
         return self._structure_stored
 
     def structure_get_actual(self) -> list[Path]:
         """Retrieves the current source structure of the project.
 
-        This method uses the `rglob` pattern to find all source files within the root directory.
+        This method uses the glob pattern to find all source files within the root directory.
 
         Returns:
-            list[Path]: List of Path objects representing the current file structure.
+            list[Path]: List of Path objects representing the current file structure, in no particular order.
         """
-        return list(self._root_path.glob(self._glob))
+        return [Path(entry.path) for entry in self._walk()]
+
+    def _walk(self) -> list[os.DirEntry[str]]:
+        """Finds all source files within the root directory matching the glob pattern.
+
+        The tree is walked with `os.scandir`, so file type checks come from the directory
+        listing itself instead of a `stat` call per entry. Pattern components are matched with
+        `fnmatch`, `**` matches zero or more directories (without following symlinks).
+
+        Returns:
+            list[os.DirEntry[str]]: Directory entries of the matching files, in no particular order.
+        """
+        parts = self._glob.split("/")
+        last = len(parts) - 1
+        entries_found: list[os.DirEntry[str]] = []
+        stack = [(str(self._root_path), 0)]
+        while stack:
+            dir_path, index = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+            # Matching zero directories - continue with the next component on the same entries
+            while parts[index] == "**" and index < last:
+                stack.extend((entry.path, index) for entry in entries if entry.is_dir(follow_symlinks=False))
+                index += 1
+
+            part = parts[index]
+            if part == "**":
+                # Trailing "**" matches directories only
+                continue
+            if index == last:
+                entries_found.extend(entry for entry in entries if fnmatch(entry.name, part) and entry.is_file())
+            else:
+                stack.extend(
+                    (entry.path, index + 1) for entry in entries if fnmatch(entry.name, part) and entry.is_dir()
+                )
+        return entries_found
 
     def structure_hash_get_actual(self) -> int:
         """Calculates the hash of the current file structure.
 
         This method is useful for detecting changes in the project's file structure.
+        Adding, removing or renaming an entry changes the mtime of its parent directory,
+        so the hash is cached along with mtimes of all project directories and the file
+        structure is only walked again if any of them changed.
 
         Returns:
             int: A hash value representing the current file structure.
         """
-        return hash(tuple(self.structure_get_actual()))
+        cached_actual = self._cached_actual
+        if cached_actual is not None and self._dir_mtimes_unchanged(cached_actual[1]):
+            return cached_actual[0]
+
+        dir_mtimes = self._dir_mtimes_get()
+        # Hash entry path strings directly, no Path objects are needed for the comparison
+        structure_hash = self.structure_hash_compute(entry.path for entry in self._walk())
+        self._cache_actual_hash(structure_hash, dir_mtimes)
+        return structure_hash
+
+    @staticmethod
+    def structure_hash_compute(paths: Iterable[str]) -> int:
+        """Calculates the hash of a file structure.
+
+        The hash doesn't depend on the order of paths, so directory listing order doesn't matter.
+        Paths are collected into a frozenset, whose hash is order-independent and computed in C.
+
+        Args:
+            paths (Iterable[str]): Paths of the source files.
+
+        Returns:
+            int: A hash value representing the file structure.
+        """
+        # Faster than an order-independent fold over hash() in Python
+        return hash(frozenset(paths))
+
+    def _cache_actual_hash(self, structure_hash: int, dir_mtimes: dict[str, int] | None) -> None:
+        """Caches the actual structure hash, if the directory mtimes snapshot can be trusted.
+
+        Args:
+            structure_hash (int): The hash of the file structure walked after taking the snapshot.
+            dir_mtimes (dict[str, int] | None): The snapshot returned by `_dir_mtimes_get`.
+        """
+        self._cached_actual = None if dir_mtimes is None else (structure_hash, dir_mtimes)
+
+    def _dir_mtimes_get(self) -> dict[str, int] | None:
+        """Collects mtimes of the root directory and all of its subdirectories.
+
+        Returns:
+            dict[str, int] | None: Directory paths mapped to their `st_mtime_ns`, or `None` if the
+                                   root directory is missing, a directory vanished during the walk, or
+                                   a directory was modified too recently to be trusted.
+        """
+        racy_threshold = time.time_ns() - _RACY_MTIME_NS
+        dir_mtimes = {}
+        try:
+            dir_mtimes[str(self._root_path)] = os.stat(self._root_path).st_mtime_ns
+            for dir_path, dir_names, _ in os.walk(self._root_path):
+                for dir_name in dir_names:
+                    sub_dir_path = os.path.join(dir_path, dir_name)
+                    dir_mtimes[sub_dir_path] = os.stat(sub_dir_path).st_mtime_ns
+        except OSError:
+            return None
+        if any(mtime >= racy_threshold for mtime in dir_mtimes.values()):
+            return None
+        return dir_mtimes
+
+    def _dir_mtimes_unchanged(self, dir_mtimes: dict[str, int]) -> bool:
+        """Checks if all directories of a snapshot still have the same mtimes.
+
+        Args:
+            dir_mtimes (dict[str, int]): The snapshot returned by `_dir_mtimes_get`.
+
+        Returns:
+            bool: `True` if no directory was modified or removed since the snapshot.
+        """
+        try:
+            return all(os.stat(dir_path).st_mtime_ns == mtime for dir_path, mtime in dir_mtimes.items())
+        except OSError:
+            return False
 
     @property
     def pages_stored(self) -> Sequence[Page]:
@@ -96,6 +230,15 @@ class Project:
         """
         return self._structure_stored
 
+    @property
+    def mtimes_stored(self) -> dict[str, float]:
+        """Returns modification timestamps of source files taken during last rebuild.
+
+        Returns:
+            dict[str, float]: Source paths (as `Page.source_path_str`) mapped to their modification timestamps.
+        """
+        return self._mtimes_stored
+
     @property
     def structure_hash_stored(self) -> int:
         """Returns hash of the project's file structure stored since last rebuild.
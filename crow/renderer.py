@@ -23,11 +23,22 @@ class BaseRenderer(ABC):
     files and generate rendered HTML pages. Subclasses must implement the `build`
     and `render` methods to provide specific rendering logic.
 
+    Attributes:
+        thread_safe: Whether `render` may be called concurrently from multiple threads.
+                     If set, pages are rendered in parallel when the project is rebuilt.
+                     Defaults to False.
+        passthrough: Whether rendered pages are exactly their source content (e.g. static HTML).
+                     If set, `render` is never called and the source is used as is.
+                     Defaults to False.
+
     Methods:
         build: Prepares the renderer for processing a collection of pages.
         render: Converts a source file into a rendered HTML page.
     """
 
+    thread_safe: bool = False
+    passthrough: bool = False
+
     @abstractmethod
     def build(self, pages: Iterable[Page]) -> None:
         """Prepares the renderer for processing a collection of pages.
@@ -0,0 +1,46 @@
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+import pytest
+
+
+def _write_file(path: Path, data: bytes = b"helo)") -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_files(root_path: Path, paths: Iterable[Path], data: bytes = b"helo)") -> None:
+    paths = list(paths)
+    for parent in {path.parent for path in paths}:
+        os.makedirs(root_path / parent, exist_ok=True)
+    for path in paths:
+        _write_file(root_path / path, data)
+
+
+def _remove_tree(path: Path) -> None:
+    for dir_path, _, file_names in os.walk(path, topdown=False):
+        for file_name in file_names:
+            os.unlink(os.path.join(dir_path, file_name))
+        os.rmdir(dir_path)
+
+
+@pytest.fixture(scope="session")
+def write_file() -> Callable[..., None]:
+    """Writes a test file through a raw file descriptor, without text layer overhead."""
+    return _write_file
+
+
+@pytest.fixture(scope="session")
+def write_files() -> Callable[..., None]:
+    """Writes test files relative to the root path, creating each parent directory once."""
+    return _write_files
+
+
+@pytest.fixture(scope="session")
+def remove_tree() -> Callable[[Path], None]:
+    """Removes a test directory tree bottom-up, test trees contain no symlinks to guard against."""
+    return _remove_tree
@@ -72,10 +72,18 @@ def test_structure():
     ), "Expected following database structure"
 
 
+def test_pragmas():
+    with db.connect() as (_, cursor):
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == "wal", "Expected database to use write-ahead log"
+        cursor.execute("PRAGMA page_size")
+        assert cursor.fetchone()[0] == 8192, "Expected page size to be set on creation"
+
+
 def test_empty():
     with db.connect() as (_, cursor):
         cursor.execute("SELECT count(*) FROM pages")
-        count = next(iter(cursor.fetchone().values()))  # get first element
+        count = cursor.fetchone()[0]
     assert count == 0, "No data shall be inserted on startup"
 
 
@@ -94,6 +102,52 @@ def test_pages_add():
     assert check_page_lists_eq(pages_retrieved, pages)
 
 
+def test_pages_add_many():
+    db.pages_clear()
+
+    # Enough pages to span several multi-row insert chunks and a tail
+    many_pages = [fake_page(title=f"page {i}") for i in range(db._INSERT_CHUNK_SIZE * 2 + 7)]
+    db.pages_add(many_pages)
+
+    with db.connect() as (_, cursor):
+        cursor.execute("SELECT * FROM pages")
+        rows = cursor.fetchall()
+    pages_retrieved = [Page(**row) for row in rows]
+    assert len(pages_retrieved) == len(many_pages)
+    assert check_page_lists_eq(pages_retrieved, many_pages)
+
+
+def test_pages_replace():
+    db.pages_clear()
+    db.pages_add(pages[:5])
+
+    # Replace with overlapping set of pages
+    db.pages_replace(pages[3:])
+
+    with db.connect() as (_, cursor):
+        cursor.execute("SELECT * FROM pages")
+        rows = cursor.fetchall()
+    pages_retrieved = [Page(**row) for row in rows]
+    assert check_page_lists_eq(pages_retrieved, pages[3:])
+
+
+def test_pages_replace_changed_only():
+    db.pages_clear()
+    db.pages_add(pages)
+
+    page_changed = pages[0].model_copy(update={"modified": 420})
+    pages_new = [page_changed, *pages[1:-1], fake_page()]
+
+    with db.connect(write=True) as (conn, _):
+        changes_before = conn.total_changes
+    db.pages_replace(pages_new)
+    with db.connect(write=True) as (conn, _):
+        changes = conn.total_changes - changes_before
+
+    assert changes == 3, "Only the changed, removed and added rows must be written"
+    assert check_page_lists_eq(db.pages_all(), pages_new)
+
+
 def test_connect_read_ok():
     db.pages_clear()
     db.pages_add(pages)
@@ -129,7 +183,7 @@ def test_connect_write_ok():
     # Check that new data appeared in db
     with db.connect() as (_, cursor):
         cursor.execute("SELECT count(*) FROM pages")
-        count = next(iter(cursor.fetchone().values()))
+        count = cursor.fetchone()[0]
     assert count == len(pages) + 1, "Expected value to be added"
 
 
@@ -210,6 +264,21 @@ def test_get_by_title_missing():
     assert page_retrieved is None, "Non-existent page must return None"
 
 
+def test_pages_all():
+    db.pages_clear()
+    db.pages_add(pages)
+
+    pages_retrieved = db.pages_all()
+    assert len(pages_retrieved) == len(pages)
+    assert check_page_lists_eq(pages_retrieved, pages)
+
+
+def test_pages_all_empty():
+    db.pages_clear()
+
+    assert db.pages_all() == [], "Empty table must return no pages"
+
+
 def test_update_modified():
     db.pages_clear()
     db.pages_add(pages)
@@ -225,6 +294,21 @@ def test_update_modified():
     assert page_new == page_retrieved, "Failed to update modified time"
 
 
+def test_db_instances(tmp_path: Path):
+    db1 = db.DB(str(tmp_path / "db1.sqlite"))
+    db2 = db.DB(str(tmp_path / "db2.sqlite"))
+    db1.pages_add(pages[:3])
+    db2.pages_add(pages[3:])
+
+    # Instances must not share connections or data with each other or the default database
+    assert check_page_lists_eq(db1.pages_all(), pages[:3])
+    assert check_page_lists_eq(db2.pages_all(), pages[3:])
+    assert db2.page_get_by_title(pages[0].title) is None
+    db1.close()
+    db2.close()
+
+
 def test_db_remove():
     assert os.path.exists("test.sqlite"), "Expected database to persist until the end of tests"
+    db.close()
     os.remove("test.sqlite")
@@ -1,13 +1,19 @@
-import shutil
-from collections.abc import Iterable
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 from crow.live import LiveProject
 from crow.model import Page
 from crow.renderer import BaseRenderer
 
 
 class TestRenderer(BaseRenderer):
+    thread_safe = True
+    passthrough = True
+
     def build(self, pages: Iterable[Page]) -> None:
         pass
 
@@ -27,11 +33,9 @@ paths = [
 ]
 
 
-def make_project(tmp_path: Path) -> LiveProject:
-    for path in paths:
-        tmp_file = tmp_path / "project" / path
-        tmp_file.parent.mkdir(parents=True, exist_ok=True)
-        tmp_file.write_text("helo)")
+@pytest.fixture
+def project(tmp_path: Path, write_files: Callable[..., None]) -> LiveProject:
+    write_files(tmp_path / "project", paths)
 
     return LiveProject(
         root_path=Path(tmp_path / "project"),
@@ -41,39 +45,158 @@ def make_project(tmp_path: Path) -> LiveProject:
     )
 
 
-def test_live_project_init(tmp_path: Path) -> None:
-    make_project(tmp_path)
+def test_live_project_init(project: LiveProject) -> None:
+    assert project.root_path.is_dir()
 
 
-def test_get_rendered_content(tmp_path: Path) -> None:
-    project = make_project(tmp_path)
+def test_get_rendered_content(project: LiveProject) -> None:
     rendered_content = project.get_rendered_content("bruh")
     assert rendered_content == "helo)"
 
 
-def test_get_rendered_content_after_file_change(tmp_path: Path) -> None:
-    project = make_project(tmp_path)
+def test_build_serial(project: LiveProject) -> None:
+    class SerialRenderer(TestRenderer):
+        thread_safe = False
+
+    project.renderer = SerialRenderer()
+    project.build()
+    for page in project.project.pages_stored:
+        assert project.page_output_path(page).read_text() == "helo)"
+
+
+def test_get_rendered_content_not_passthrough(project: LiveProject) -> None:
+    class UpperRenderer(TestRenderer):
+        passthrough = False
+
+        def render(self, page_source: str, page_metadata: Page) -> str:
+            return page_source.upper()
+
+    project.renderer = UpperRenderer()
+    assert project.get_rendered_content("bruh") == "HELO)"
+
+
+def test_get_rendered_content_missing(project: LiveProject) -> None:
+    assert project.get_rendered_content("foo") is None
+
+
+def test_get_rendered_content_after_file_change(project: LiveProject, write_file: Callable[..., None]) -> None:
     change_path = project.root_path / "chapter 2" / "bruh.html"
-    change_path.write_text("bye(")
+    write_file(change_path, b"bye(")
 
     rendered_content = project.get_rendered_content("bruh")
     assert rendered_content == "bye("
 
 
-def test_get_rendered_content_after_structure_change(tmp_path: Path) -> None:
-    project = make_project(tmp_path)
+def test_get_rendered_content_repeated_after_file_change(project: LiveProject, write_file: Callable[..., None]) -> None:
+    change_path = project.root_path / "chapter 2" / "bruh.html"
+    assert project.get_rendered_content("bruh") == "helo)"
+    assert project.get_rendered_content("bruh") == "helo)"
+
+    write_file(change_path, b"bye(")
+    # Make sure timestamp differs even on filesystems with coarse timestamps
+    change_time = os.path.getmtime(change_path) + 10
+    os.utime(change_path, (change_time, change_time))
+
+    assert project.get_rendered_content("bruh") == "bye("
+    assert project.get_rendered_content("bruh") == "bye("
+
+
+def test_flush(project: LiveProject, write_file: Callable[..., None]) -> None:
+    assert project.get_rendered_content("bruh") == "helo)"
+
+    change_path = project.root_path / "chapter 2" / "bruh.html"
+    write_file(change_path, b"bye(")
+    change_time = os.path.getmtime(change_path) + 10
+    os.utime(change_path, (change_time, change_time))
+    assert project.get_rendered_content("bruh") == "bye("
+
+    # Timestamp is only persisted on flush
+    assert project.db.page_get_by_title("bruh").modified != change_time
+    project.flush()
+    assert project.db.page_get_by_title("bruh").modified == change_time
+
+
+def test_get_rendered_content_cached(project: LiveProject, write_file: Callable[..., None]) -> None:
+    assert project.get_rendered_content("bruh") == "helo)"
+
+    # Served from memory, the output file isn't read again
+    output_path = project.build_path / "bruh.html"
+    output_path.unlink()
+    assert project.get_rendered_content("bruh") == "helo)"
+    assert not output_path.exists()
+
+    # Source changes are still picked up
+    change_path = project.root_path / "chapter 2" / "bruh.html"
+    write_file(change_path, b"bye(")
+    change_time = os.path.getmtime(change_path) + 10
+    os.utime(change_path, (change_time, change_time))
+    assert project.get_rendered_content("bruh") == "bye("
+    assert output_path.read_text() == "bye("
+
+
+def test_get_rendered_content_threads(project: LiveProject, tmp_path: Path) -> None:
+    project.build()
+    titles = [page.title for page in project.project.pages_stored] * 50
+    assert titles
+
+    root_path = project.root_path
+    for i in range(10):
+        # Fresh project over the same sources, so the first requests race to build it
+        project = LiveProject(
+            root_path=root_path,
+            build_path=tmp_path / f"build {i}",
+            renderer=global_renderer,
+            db_path=str(tmp_path / f"db {i}" / "pages.sqlite"),
+        )
+
+        def request(title: str, project: LiveProject = project) -> str | None:
+            project.flush()
+            return project.get_rendered_content(title)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert list(executor.map(request, titles)) == ["helo)"] * len(titles)
+
+
+def test_close(project: LiveProject, write_file: Callable[..., None]) -> None:
+    with project:
+        change_path = project.root_path / "chapter 2" / "bruh.html"
+        write_file(change_path, b"bye(")
+        change_time = os.path.getmtime(change_path) + 10
+        os.utime(change_path, (change_time, change_time))
+        assert project.get_rendered_content("bruh") == "bye("
+
+    # Pending timestamps are flushed on close, and the database is reopened on demand
+    assert project.db.page_get_by_title("bruh").modified == change_time
+    assert project.get_rendered_content("bruh") == "bye("
+
+
+def test_get_rendered_content_after_build_removed(
+    project: LiveProject, write_file: Callable[..., None], remove_tree: Callable[[Path], None]
+) -> None:
+    assert project.get_rendered_content("bruh") == "helo)"
+    remove_tree(project.build_path)
+
+    change_path = project.root_path / "chapter 2" / "bruh.html"
+    write_file(change_path, b"bye(")
+    change_time = os.path.getmtime(change_path) + 10
+    os.utime(change_path, (change_time, change_time))
+
+    assert project.get_rendered_content("bruh") == "bye("
+    assert (project.build_path / "bruh.html").read_text() == "bye("
+
+
+def test_get_rendered_content_after_structure_change(
+    project: LiveProject, write_files: Callable[..., None], remove_tree: Callable[[Path], None]
+) -> None:
     project_path = project.root_path
-    shutil.rmtree(project_path)
+    remove_tree(project_path)
 
     new_paths = [
         Path("hello", "bruh.html"),
         Path("world.html"),
     ]
 
-    for path in new_paths:
-        tmp_file = project_path / path
-        tmp_file.parent.mkdir(parents=True, exist_ok=True)
-        tmp_file.write_text("whatever")
+    write_files(project_path, new_paths, b"whatever")
 
     rendered_content = project.get_rendered_content("bruh")
     assert rendered_content == "whatever"
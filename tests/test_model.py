@@ -1,5 +1,7 @@
+import os
 from pathlib import Path
 
+import pytest
 from faker import Faker
 
 from crow.model import Page
@@ -20,6 +22,48 @@ def test_from_source_path():
     assert page.toc_path == "source/chapter 1/Does the suffering ever end or does it merely transform"
 
 
+def test_from_source_path_outside_project():
+    with pytest.raises(ValueError):
+        Page.from_source_path(Path("books", "other-book", "index.html"), Path("books", "crow-book"))
+
+
+def test_from_source_path_relative_project():
+    for project_dir in [Path("."), Path()]:
+        page = Page.from_source_path(Path("x.html"), project_dir)
+        assert page.title == "x"
+        assert page.toc_path == ""
+
+        page = Page.from_source_path(Path("chapter 1", "index.html"), project_dir)
+        assert page.title == "chapter 1"
+        assert page.toc_path == "chapter 1"
+
+
+def test_from_dir_entry(tmp_path: Path):
+    project_dir = tmp_path / "crow-book"
+    source_dir = project_dir / "source" / "chapter 1"
+    source_dir.mkdir(parents=True)
+    (source_dir / "Does the suffering ever end or does it merely transform.html").write_text("helo)")
+    (source_dir / "index.html").write_text("helo)")
+    (project_dir / "index.html").write_text("helo)")
+
+    def page_from_entry(dir_path: Path, name: str) -> Page:
+        with os.scandir(dir_path) as it:
+            entry = next(entry for entry in it if entry.name == name)
+        return Page.from_dir_entry(entry, project_dir)
+
+    for dir_path, name in [
+        (source_dir, "Does the suffering ever end or does it merely transform.html"),
+        (source_dir, "index.html"),
+        (project_dir, "index.html"),
+    ]:
+        page = page_from_entry(dir_path, name)
+        assert page == Page.from_source_path(dir_path / name, project_dir)
+
+    page = page_from_entry(source_dir, "Does the suffering ever end or does it merely transform.html")
+    assert page.title == "Does the suffering ever end or does it merely transform"
+    assert page.toc_path == "source/chapter 1/Does the suffering ever end or does it merely transform"
+
+
 # def test_toc_from_ordered_pages():
 #     pages = [
 #         fake_page(toc_path="", title=""),  # index doc
@@ -40,3 +84,9 @@ def test_from_source_path():
 #     ]
 #
 #     assert toc_expected == toc
+
+
+def test_from_row():
+    source_path = Path("crow-book", "chapter 1", "index.html")
+    page = Page(title="chapter 1", source_path=source_path, toc_path="chapter 1", modified=1.5)
+    assert Page.from_row((page.title, str(page.source_path), page.toc_path, page.modified)) == page
@@ -1,9 +1,12 @@
-import shutil
+import os
+import time
+from collections.abc import Callable
 from pathlib import Path
 
+import pytest
+
 from crow.project import Project
 
-global_project: Project | None = None
 paths = [
     Path("index.html"),
     Path("chapter 1", "1.1. Welcome.html"),
@@ -15,24 +18,35 @@ paths = [
 ]
 
 
-def test_project_init(tmp_path: Path) -> None:
-    global global_project
-    # setup filesystem
-    for path in paths:
-        tmp_inner_path = tmp_path / "project" / path
-        tmp_inner_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_inner_path.write_text("helo)")
+@pytest.fixture
+def project_path(tmp_path: Path, write_files: Callable[..., None]) -> Path:
+    project_path = tmp_path / "project"
+    write_files(project_path, paths)
+    return project_path
+
+
+@pytest.fixture(scope="module")
+def global_project(tmp_path_factory: pytest.TempPathFactory, write_files: Callable[..., None]) -> Project:
+    # Built once and shared by read-only tests of this module
+    project_path = tmp_path_factory.mktemp("project")
+    write_files(project_path, paths)
+    project = Project(project_path)
+    project.build()
+    return project
 
-    global_project = Project(tmp_path / "project")
-    global_project.build()
 
+def test_project_init(project_path: Path) -> None:
+    project = Project(project_path)
+    project.build()
+    assert len(project.pages_stored) == len(paths)
 
-def test_project_structure(tmp_path: Path) -> None:
+
+def test_project_structure(global_project: Project) -> None:
     paths_retrieved = [page.source_path.relative_to(global_project.root_path) for page in global_project.pages_stored]
     assert set(paths) == set(paths_retrieved)
 
 
-def test_project_titles():
+def test_project_titles(global_project: Project) -> None:
     titles = [
         "",
         "1.1. Welcome",
@@ -47,7 +61,7 @@ def test_project_titles():
     assert set(titles) == set(titles_retrieved)
 
 
-def test_project_toc():
+def test_project_toc(global_project: Project) -> None:
     toc = [
         "",
         "chapter 1/1.1. Welcome",
@@ -62,7 +76,9 @@ def test_project_toc():
     assert set(toc) == set(toc_retrieved)
 
 
-def test_project_rebuild(tmp_path: Path) -> None:
+def test_project_rebuild(
+    project_path: Path, write_files: Callable[..., None], remove_tree: Callable[[Path], None]
+) -> None:
     new_paths = [
         Path("chapter 1", "1.1. Welcome.html"),
         Path("chapter 1", "1.2. Semantic compositions on trolling and its meaning.html"),
@@ -78,20 +94,88 @@ def test_project_rebuild(tmp_path: Path) -> None:
         "chapter 1/1.2. Semantic compositions on trolling and its meaning",
     ]
 
-    project_path = global_project.root_path
-    shutil.rmtree(project_path, ignore_errors=True)
+    project = Project(project_path)
+    project.build()
+    remove_tree(project_path)
 
-    for path in new_paths:
-        tmp_inner_path = project_path / path
-        tmp_inner_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_inner_path.write_text("q")
+    write_files(project_path, new_paths, b"q")
 
-    global_project.build()
+    project.build()
 
-    paths_received = [page.source_path.relative_to(project_path) for page in global_project.pages_stored]
-    titles_received = [str(page.title) for page in global_project.pages_stored]
-    toc_received = [str(page.toc_path) for page in global_project.pages_stored]
+    paths_received = [page.source_path.relative_to(project_path) for page in project.pages_stored]
+    titles_received = [str(page.title) for page in project.pages_stored]
+    toc_received = [str(page.toc_path) for page in project.pages_stored]
 
     assert set(paths_received) == set(new_paths)
     assert set(titles_received) == set(new_titles)
     assert set(toc_received) == set(new_toc)
+
+
+def test_project_structure_hash_cached(
+    project_path: Path, monkeypatch: pytest.MonkeyPatch, write_file: Callable[..., None]
+) -> None:
+    # Age directories, so their mtimes are trusted by the structure hash cache
+    old_time = time.time() - 60
+    for dir_path, _, _ in os.walk(project_path):
+        os.utime(dir_path, (old_time, old_time))
+
+    # Count walks of the file structure, the cache must avoid them
+    walks = 0
+    walk = Project._walk
+
+    def walk_counted(self: Project) -> list[os.DirEntry[str]]:
+        nonlocal walks
+        walks += 1
+        return walk(self)
+
+    monkeypatch.setattr(Project, "_walk", walk_counted)
+
+    project = Project(project_path)
+    project.build()
+    walks = 0
+    assert project.structure_hash_get_actual() == project.structure_hash_stored
+    assert project.structure_hash_get_actual() == project.structure_hash_stored
+    assert walks == 0
+
+    # Content changes don't affect the structure, nor directory mtimes
+    write_file(project_path / paths[0], b"bye(")
+    assert project.structure_hash_get_actual() == project.structure_hash_stored
+    assert walks == 0
+
+    # Adding a file to a nested directory does, and the structure is walked again
+    write_file(project_path / "chapter 2" / "part 1" / "paragraph 1" / "gru.html")
+    assert project.structure_hash_get_actual() != project.structure_hash_stored
+    assert walks == 1
+
+
+def test_project_glob(tmp_path: Path, write_files: Callable[..., None]) -> None:
+    project_path = tmp_path / "project"
+    write_files(project_path, [*paths, Path("chapter 1", "notes.md"), Path("chapter 2", "part 1", "draft.md")])
+
+    def structure(glob: str) -> set[Path]:
+        return {path.relative_to(project_path) for path in Project(project_path, glob).build()}
+
+    assert structure("**/*.html") == set(paths)
+    assert structure("*.html") == {Path("index.html")}
+    assert structure("chapter 1/*.html") == {path for path in paths if path.parent == Path("chapter 1")}
+    assert structure("chapter 2/**/*.html") == {path for path in paths if path.parts[0] == "chapter 2"}
+    assert structure("**/*.md") == {Path("chapter 1", "notes.md"), Path("chapter 2", "part 1", "draft.md")}
+    assert structure("**/part 1/**/*") == {Path("chapter 2", "part 1", "draft.md"), paths[-1]}
+
+
+def test_project_mtimes_stored(project_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Keys match page source paths, also for a relative root
+    for root_path in [project_path, Path(".")]:
+        monkeypatch.chdir(project_path)
+        project = Project(root_path)
+        project.build()
+        mtimes = project.mtimes_stored
+        assert len(mtimes) == len(paths)
+        assert set(mtimes) == {page.source_path_str for page in project.pages_stored}
+        assert all(mtime == os.path.getmtime(path) for path, mtime in mtimes.items())
+
+
+def test_project_structure_hash_compute() -> None:
+    structure = [str(path) for path in paths]
+    assert Project.structure_hash_compute(structure) == Project.structure_hash_compute(reversed(structure))
+    assert Project.structure_hash_compute(structure) != Project.structure_hash_compute(structure[1:])